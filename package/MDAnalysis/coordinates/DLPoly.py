@@ -43,6 +43,9 @@ class Timestep(base.Timestep):
 
     @property
     def dimensions(self):
+        return self._cached_dimensions(self._box_from_unitcell)
+
+    def _box_from_unitcell(self):
         return core.triclinic_box(*self._unitcell)
 
     @dimensions.setter
@@ -128,6 +128,9 @@ class Timestep(base.Timestep):
     @property
     def dimensions(self):
         """unitcell dimensions (A, B, C, alpha, beta, gamma)"""
+        return self._cached_dimensions(self._box_from_unitcell)
+
+    def _box_from_unitcell(self):
         return triclinic_box(self._unitcell[0], self._unitcell[1], self._unitcell[2])
 
     @dimensions.setter
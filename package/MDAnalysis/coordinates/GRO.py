@@ -142,6 +142,9 @@ class Timestep(base.Timestep):
                  [  0.        ,  80.00515747,   0.        ],
                  [ 40.00257874,  40.00257874,  56.57218552]], dtype=float32)
         """
+        return self._cached_dimensions(self._box_from_unitcell)
+
+    def _box_from_unitcell(self):
         # unit cell line (from http://manual.gromacs.org/current/online/gro.html)
         # v1(x) v2(y) v3(z) v1(y) v1(z) v2(x) v2(z) v3(x) v3(y)
         # 0     1     2      3     4     5     6    7     8
@@ -228,7 +228,10 @@ class Timestep(base.Timestep):
         the rows of the matrix.
         """
         if self._unitcell is not None:
-            return core.triclinic_box(*self._unitcell)
+            return self._cached_dimensions(self._box_from_unitcell)
+
+    def _box_from_unitcell(self):
+        return core.triclinic_box(*self._unitcell)
 
     @dimensions.setter
     def dimensions(self, box):
@@ -105,6 +105,9 @@ class Timestep(base.Timestep):
         """
         Unit cell dimensions ``[A,B,C,alpha,beta,gamma]``.
         """
+        return self._cached_dimensions(self._box_from_unitcell)
+
+    def _box_from_unitcell(self):
         x = self._unitcell[0:3]
         y = self._unitcell[3:6]
         z = self._unitcell[6:9]
@@ -267,11 +267,21 @@ class XDRBaseReader(base.ReaderBase):
             raise IOError(errno.EIO, 'trying to go over trajectory limit')
         if ts is None:
             ts = self.ts
-        frame = self._xdr.read()
+        frame = self._read_xdr_frame(ts)
         self._frame += 1
         self._frame_to_ts(frame, ts)
         return ts
 
+    def _read_xdr_frame(self, ts):
+        """read the next frame from the file, `ts` is the timestep it is for"""
+        return self._xdr.read()
+
+    def _read_next_timestep_or_none(self):
+        """copy next frame into timestep, ``None`` after the last frame"""
+        if self._frame == self.n_frames - 1:
+            return None
+        return super(XDRBaseReader, self)._read_next_timestep_or_none()
+
     def Writer(self, filename, n_atoms=None, **kwargs):
         """Return writer for trajectory format"""
         if n_atoms is None:
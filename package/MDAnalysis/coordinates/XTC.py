@@ -31,7 +31,10 @@ See Also
 MDAnalysis.coordinates.TRR: Read and write GROMACS TRR trajectory files.
 MDAnalysis.coordinates.XDR: BaseReader/Writer for XDR based formats
 """
+import numpy as np
+
 from . import base
+from ..exceptions import NoDataError
 from .XDR import XDRBaseReader, XDRBaseWriter
 from ..lib.formats.libmdaxdr import XTCFile
 from ..lib.mdamath import triclinic_vectors, triclinic_box
@@ -99,14 +102,50 @@ class XTCWriter(XDRBaseWriter):
                 errmsg = "Input obj is neither an AtomGroup or Universe"
                 raise TypeError(errmsg) from None
 
-        xyz = ts.positions.copy()
-        time = ts.time
-        step = ts.frame
-        dimensions = ts.dimensions
+        self.write_frame(ts.positions, ts.dimensions, ts.frame, ts.time)
+
+    def write_frame(self, positions, dimensions, step=0, time=0.0):
+        """Write coordinate arrays as the next frame of the trajectory
+
+        Fast path for converting trajectories that are held in NumPy arrays
+        without wrapping every frame into an
+        :class:`~MDAnalysis.core.groups.AtomGroup`.
+
+        Parameters
+        ----------
+        positions : array_like
+            positions of shape ``(n_atoms, 3)`` in Å
+        dimensions : array_like
+            unitcell dimensions ``[A, B, C, alpha, beta, gamma]`` with
+            lengths in Å and angles in degrees
+        step : int (optional)
+            integration step of the frame
+        time : float (optional)
+            time of the frame in ps
 
+        Raises
+        ------
+        ValueError
+            if `positions` is not of shape ``(n_atoms, 3)`` or `dimensions`
+            is not of shape ``(6,)``
+
+
+        .. versionadded:: 2.0.0
+        """
+        positions = np.asarray(positions)
+        dimensions = np.asarray(dimensions, dtype=np.float32)
+        if positions.shape != (self.n_atoms, 3):
+            raise ValueError("positions must have shape ({}, 3), got {}"
+                             "".format(self.n_atoms, positions.shape))
+        if dimensions.shape != (6,):
+            raise ValueError("dimensions must have shape (6,), got {}"
+                             "".format(dimensions.shape))
+        xyz = positions
         if self._convert_units:
-            xyz = self.convert_pos_to_native(xyz, inplace=False)
-            dimensions = self.convert_dimensions_to_unitcell(ts, inplace=False)
+            xyz = self.convert_pos_to_native(positions, inplace=False)
+            dimensions = np.concatenate([
+                self.convert_pos_to_native(dimensions[:3], inplace=False),
+                dimensions[3:]])
 
         box = triclinic_vectors(dimensions)
         # libmdaxdr will multiply the coordinates by precision. This means for
@@ -116,6 +155,18 @@ class XTCWriter(XDRBaseWriter):
         self._xdr.write(xyz, box, step, time, precision)
 
 
+class Timestep(base.Timestep):
+    """XTC Timestep
+
+    Positions are stored in C order so that frames can be decoded directly
+    into them.
+
+
+    .. versionadded:: 2.0.0
+    """
+    order = 'C'
+
+
 class XTCReader(XDRBaseReader):
     """Reader for the Gromacs XTC trajectory format.
 
@@ -135,6 +186,14 @@ class XTCReader(XDRBaseReader):
     units = {'time': 'ps', 'length': 'nm'}
     _writer = XTCWriter
     _file = XTCFile
+    _Timestep = Timestep
+
+    def _read_xdr_frame(self, ts):
+        """read the next frame, decoding into the positions of `ts`"""
+        if (self._sub is None and ts.has_positions and
+                ts._pos.flags.c_contiguous):
+            return self._xdr.read_direct_x(ts._pos)
+        return self._xdr.read()
 
     def _frame_to_ts(self, frame, ts):
         """convert a xtc-frame to a mda TimeStep"""
@@ -145,10 +204,137 @@ class XTCReader(XDRBaseReader):
 
         if self._sub is not None:
             ts.positions = frame.x[self._sub]
-        else:
+        elif not (ts.has_positions and frame.x is ts._pos):
             ts.positions = frame.x
         if self.convert_units:
             self.convert_pos_from_native(ts.positions)
             self.convert_pos_from_native(ts.dimensions[:3])
 
         return ts
+
+    def timeseries(self, asel=None, start=None, stop=None, step=None,
+                   order='afc'):
+        """Return a subset of coordinate data for an AtomGroup
+
+        All requested frames are decoded into one preallocated array instead
+        of a separate array per frame.
+
+        Parameters
+        ----------
+        asel : :class:`~MDAnalysis.core.groups.AtomGroup`
+            The :class:`~MDAnalysis.core.groups.AtomGroup` to read the
+            coordinates from. Defaults to None, in which case the full set of
+            coordinate data is returned.
+        start : int (optional)
+            Begin reading the trajectory at frame index `start` (where 0 is the
+            index of the first frame in the trajectory); the default ``None``
+            starts at the beginning.
+        stop : int (optional)
+            End reading the trajectory at frame index `stop`-1, i.e, `stop` is
+            excluded. The trajectory is read to the end with the default
+            ``None``.
+        step : int (optional)
+            Step size for reading; the default ``None`` is equivalent to 1 and
+            means to read every frame.
+        order : str (optional)
+            the order/shape of the return data array, corresponding
+            to (a)tom, (f)rame, (c)oordinates all six combinations
+            of 'a', 'f', 'c' are allowed ie "fac" - return array
+            where the shape is (frame, number of atoms,
+            coordinates)
+
+        Note
+        ----
+        Transformations are not applied to the returned coordinates. The
+        current frame of the reader is not changed.
+
+
+        .. versionadded:: 2.0.0
+        """
+        start, stop, step = self.check_slice_indices(start, stop, step)
+
+        indices = self._sub
+        if asel is not None:
+            if len(asel) == 0:
+                raise NoDataError(
+                    "Timeseries requires at least one atom to analyze")
+            indices = asel.indices
+            if self._sub is not None:
+                indices = self._sub[indices]
+        n_atoms = self.n_atoms if indices is None else len(indices)
+
+        frames = range(start, stop, step)
+        xyz = np.empty((len(frames), n_atoms, 3), dtype=np.float32)
+        try:
+            for i, frame in enumerate(frames):
+                self._xdr.seek(frame)
+                if indices is None:
+                    self._xdr.read_direct_x(xyz[i])
+                else:
+                    xyz[i] = self._xdr.read().x[indices]
+        finally:
+            self._restore_xdr_position()
+        if self.convert_units:
+            self.convert_pos_from_native(xyz)
+
+        return np.transpose(xyz, ['fac'.index(axis) for axis in order])
+
+    def iter_chunks(self, chunksize=64):
+        """Iterate over the coordinates of the trajectory in blocks of frames
+
+        Frames are decoded `chunksize` at a time in a single call into the
+        XTC library, skipping the per-frame update of the :class:`Timestep`.
+        This is faster for analyses that only need the coordinates of every
+        frame.
+
+        Parameters
+        ----------
+        chunksize : int (optional)
+            maximum number of frames in each block
+
+        Yields
+        ------
+        numpy.ndarray
+            array of shape ``(n_frames_in_chunk, n_atoms, 3)`` holding the
+            positions of consecutive frames. The underlying buffer is reused,
+            so copy the array if it must outlive the next iteration.
+
+        Note
+        ----
+        Transformations and auxiliary data are not applied to the chunks. The
+        current frame of the reader is not changed, so the reader can still
+        be used, including random access, while the iteration is in progress.
+
+
+        .. versionadded:: 2.0.0
+        """
+        n_atoms = self._xdr.n_atoms
+        xyz = np.empty((chunksize, n_atoms, 3), dtype=np.float32)
+        box = np.empty((chunksize, 3, 3), dtype=np.float32)
+        step = np.empty(chunksize, dtype=np.int32)
+        time = np.empty(chunksize, dtype=np.float32)
+
+        frame = 0
+        n_read = chunksize
+        while n_read == chunksize and frame < self.n_frames:
+            # the reader may have been moved since the last chunk, so seek
+            # explicitly and put the file back before handing out the chunk
+            self._xdr.seek(frame)
+            try:
+                n_read = self._xdr.read_chunk(xyz, box, step, time)
+            finally:
+                self._restore_xdr_position()
+            if n_read == 0:
+                break
+            frame += n_read
+            positions = xyz[:n_read]
+            if self._sub is not None:
+                positions = positions[:, self._sub]
+            if self.convert_units:
+                self.convert_pos_from_native(positions)
+            yield positions
+
+    def _restore_xdr_position(self):
+        """Put the file back to where the reader left off"""
+        if self._frame + 1 < self.n_frames:
+            self._xdr.seek(self._frame + 1)
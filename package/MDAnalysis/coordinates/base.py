@@ -114,6 +114,7 @@ MDAnalysis.
    .. automethod:: __iter__
    .. automethod:: copy
    .. automethod:: copy_slice
+   .. automethod:: copy_into
 
 
 FrameIterators
@@ -300,6 +301,8 @@ class Timestep(object):
         self.has_forces = kwargs.get('forces', False)
 
         self._unitcell = self._init_unitcell()
+        # (unitcell bytes, dimensions) of the last _cached_dimensions() call
+        self._dimensions_cache = (None, None)
 
         # set up aux namespace for adding auxiliary data
         self.aux = Namespace()
@@ -311,40 +314,72 @@ class Timestep(object):
         .. versionadded:: 0.11.0
         """
         ts = cls(other.n_atoms,
-                 positions=other.has_positions,
-                 velocities=other.has_velocities,
-                 forces=other.has_forces,
+                 positions=False,
+                 velocities=False,
+                 forces=False,
                  **kwargs)
-        ts.frame = other.frame
-        ts.dimensions = other.dimensions
-        try:
-            ts.positions = other.positions.copy(order=cls.order)
-        except NoDataError:
-            pass
-        try:
-            ts.velocities = other.velocities.copy(order=cls.order)
-        except NoDataError:
-            pass
-        try:
-            ts.forces = other.forces.copy(order=cls.order)
-        except NoDataError:
-            pass
-
-        # Optional attributes that don't live in .data
-        # should probably iron out these last kinks
-        for att in ('_frame',):
-            try:
-                setattr(ts, att, getattr(other, att))
-            except AttributeError:
-                pass
+        other.copy_into(ts)
 
         if hasattr(ts, '_reader'):
             other._reader = weakref.ref(ts._reader())
 
-        ts.data = copy.deepcopy(other.data)
-
         return ts
 
+    def copy_into(self, other):
+        """Copy the contents of this Timestep into the existing Timestep `other`
+
+        Position, velocity and force arrays already held by `other` are
+        overwritten in place when they have the right shape, so that taking
+        repeated snapshots of a trajectory does not allocate new arrays for
+        every frame.
+
+        Parameters
+        ----------
+        other : Timestep
+            The Timestep to copy into. It must describe the same number of
+            atoms as this Timestep.
+
+        Raises
+        ------
+        ValueError
+            if `other` has a different number of atoms
+
+
+        .. versionadded:: 2.0.0
+        """
+        if other.n_atoms != self.n_atoms:
+            raise ValueError("Cannot copy a Timestep with {} atoms into a "
+                             "Timestep with {} atoms".format(self.n_atoms,
+                                                             other.n_atoms))
+        other.frame = self.frame
+        other.dimensions = self.dimensions
+
+        if self.has_positions:
+            other._pos = other._copied_buffer('_pos', self._pos)
+            other._has_positions = True
+        else:
+            other.has_positions = False
+        if self.has_velocities:
+            other._velocities = other._copied_buffer('_velocities',
+                                                     self._velocities)
+            other._has_velocities = True
+        else:
+            other.has_velocities = False
+        if self.has_forces:
+            other._forces = other._copied_buffer('_forces', self._forces)
+            other._has_forces = True
+        else:
+            other.has_forces = False
+
+        # Optional attributes that don't live in .data
+        # should probably iron out these last kinks
+        try:
+            other._frame = self._frame
+        except AttributeError:
+            pass
+
+        other.data = copy.deepcopy(self.data)
+
     @classmethod
     def from_coordinates(cls,
                          positions=None,
@@ -371,16 +406,21 @@ class Timestep(object):
             raise ValueError("Lengths of input data mismatched")
 
         ts = cls(n_atoms,
-                 positions=has_positions,
-                 velocities=has_velocities,
-                 forces=has_forces,
+                 positions=False,
+                 velocities=False,
+                 forces=False,
                  **kwargs)
+        # The arrays are filled straight away, so allocate them uninitialised
+        # rather than zeroing them first through the has_* properties
         if has_positions:
-            ts.positions = positions
+            ts._pos = ts._filled_buffer(positions)
+            ts._has_positions = True
         if has_velocities:
-            ts.velocities = velocities
+            ts._velocities = ts._filled_buffer(velocities)
+            ts._has_velocities = True
         if has_forces:
-            ts.forces = forces
+            ts._forces = ts._filled_buffer(forces)
+            ts._has_forces = True
 
         return ts
 
@@ -405,6 +445,36 @@ class Timestep(object):
         # override for other Timesteps
         return np.zeros((6), np.float32)
 
+    def _cached_dimensions(self, box_from_unitcell):
+        """Return :attr:`dimensions` computed by `box_from_unitcell`
+
+        Timesteps that store the unit cell as box vectors have to convert it
+        on every access of :attr:`dimensions`. The result is reused for as
+        long as the content of :attr:`_unitcell` does not change, so that
+        repeated accesses within the same frame are cheap.
+
+        Parameters
+        ----------
+        box_from_unitcell : callable
+            Function without arguments returning the unitcell dimensions
+            ``[A, B, C, alpha, beta, gamma]`` for the current
+            :attr:`_unitcell`.
+
+        Returns
+        -------
+        numpy.ndarray
+            A copy of the (cached) unitcell dimensions.
+
+
+        .. versionadded:: 2.0.0
+        """
+        key = self._unitcell.tobytes()
+        cached_key, box = self._dimensions_cache
+        if key != cached_key:
+            box = box_from_unitcell()
+            self._dimensions_cache = (key, box)
+        return box.copy()
+
     def __eq__(self, other):
         """Compare with another Timestep
 
@@ -571,14 +641,17 @@ class Timestep(object):
 
         new_TS.frame = self.frame
 
-        for att in ('_frame',):
-            try:
-                setattr(new_TS, att, getattr(self, att))
-            except AttributeError:
-                pass
+        try:
+            new_TS._frame = self._frame
+        except AttributeError:
+            pass
 
-        if hasattr(self, '_reader'):
-            new_TS._reader = weakref.ref(self._reader())
+        try:
+            reader = self._reader
+        except AttributeError:
+            pass
+        else:
+            new_TS._reader = weakref.ref(reader())
 
         new_TS.data = copy.deepcopy(self.data)
 
@@ -597,6 +670,66 @@ class Timestep(object):
         # - not sure how to manage existing data upon extension
         return self._n_atoms
 
+    def _zeroed_buffer(self, attr):
+        """Return an all-zero ``(n_atoms, 3)`` array to be stored as `attr`
+
+        Formats such as TRR switch velocities and forces on and off between
+        frames. Instead of allocating a new array every time data becomes
+        available again, an array previously allocated by this Timestep is
+        wiped and reused. Arrays not owned by the Timestep (e.g. views into
+        the trajectory of a :class:`~MDAnalysis.coordinates.memory.MemoryReader`)
+        are never reused.
+
+
+        .. versionadded:: 2.0.0
+        """
+        buf = self._reusable_buffer(attr)
+        if buf is not None:
+            buf.fill(0)
+            return buf
+        return np.zeros((self.n_atoms, 3), dtype=np.float32, order=self.order)
+
+    def _copied_buffer(self, attr, data):
+        """Return a ``(n_atoms, 3)`` array holding a copy of `data`
+
+        The array currently stored as `attr` is overwritten if it can be
+        reused (see :meth:`_zeroed_buffer`), otherwise a new array is created.
+
+
+        .. versionadded:: 2.0.0
+        """
+        buf = self._reusable_buffer(attr)
+        if buf is not None:
+            np.copyto(buf, data)
+            return buf
+        return self._filled_buffer(data)
+
+    def _reusable_buffer(self, attr):
+        """Return the array stored as `attr` if this Timestep owns it
+
+        ``None`` is returned if there is no such array, if it is a view onto
+        memory owned by somebody else or if it doesn't have shape
+        ``(n_atoms, 3)`` and dtype :class:`numpy.float32`.
+
+
+        .. versionadded:: 2.0.0
+        """
+        buf = self.__dict__.get(attr)
+        if (buf is not None and buf.flags.owndata and
+                buf.shape == (self.n_atoms, 3) and buf.dtype == np.float32):
+            return buf
+        return None
+
+    def _filled_buffer(self, data):
+        """Return a new ``(n_atoms, 3)`` array holding a copy of `data`
+
+
+        .. versionadded:: 2.0.0
+        """
+        buf = np.empty((self.n_atoms, 3), dtype=np.float32, order=self.order)
+        buf[:] = data
+        return buf
+
     @property
     def has_positions(self):
         """A boolean of whether this Timestep has position data
@@ -611,11 +744,10 @@ class Timestep(object):
     @has_positions.setter
     def has_positions(self, val):
         if val and not self._has_positions:
-            # Setting this will always reallocate position data
+            # Setting this will always wipe position data
             # ie
             # True -> False -> True will wipe data from first True state
-            self._pos = np.zeros((self.n_atoms, 3), dtype=np.float32,
-                                 order=self.order)
+            self._pos = self._zeroed_buffer('_pos')
             self._has_positions = True
         elif not val:
             # Unsetting val won't delete the numpy array
@@ -693,8 +825,7 @@ class Timestep(object):
     @has_velocities.setter
     def has_velocities(self, val):
         if val and not self._has_velocities:
-            self._velocities = np.zeros((self.n_atoms, 3), dtype=np.float32,
-                                        order=self.order)
+            self._velocities = self._zeroed_buffer('_velocities')
             self._has_velocities = True
         elif not val:
             self._has_velocities = False
@@ -743,8 +874,7 @@ class Timestep(object):
     @has_forces.setter
     def has_forces(self, val):
         if val and not self._has_forces:
-            self._forces = np.zeros((self.n_atoms, 3), dtype=np.float32,
-                                    order=self.order)
+            self._forces = self._zeroed_buffer('_forces')
             self._has_forces = True
         elif not val:
             self._has_forces = False
@@ -1456,16 +1586,15 @@ class ProtoReader(IOBase, metaclass=_Readermeta):
 
     def next(self):
         """Forward one step to next frame."""
-        try:
-            ts = self._read_next_timestep()
-        except (EOFError, IOError):
+        ts = self._read_next_timestep_or_none()
+        if ts is None:
             self.rewind()
-            raise StopIteration from None
-        else:
-            for auxname in self.aux_list:
-                ts = self._auxs[auxname].update_ts(ts)
+            raise StopIteration
+
+        for auxname in self.aux_list:
+            ts = self._auxs[auxname].update_ts(ts)
 
-            ts = self._apply_transformations(ts)
+        ts = self._apply_transformations(ts)
 
         return ts
 
@@ -1553,6 +1682,21 @@ class ProtoReader(IOBase, metaclass=_Readermeta):
         raise NotImplementedError(
             "BUG: Override _read_next_timestep() in the trajectory reader!")
 
+    def _read_next_timestep_or_none(self):
+        """Read the next frame or return ``None`` at the end of the trajectory
+
+        Readers that can tell cheaply that the last frame has been reached
+        should override this method to skip raising and catching an
+        exception at the end of every iteration.
+
+
+        .. versionadded:: 2.0.0
+        """
+        try:
+            return self._read_next_timestep()
+        except (EOFError, IOError):
+            return None
+
     def __iter__(self):
         """ Iterate over trajectory frames. """
         self._reopen()
@@ -547,6 +547,12 @@ class MemoryReader(base.ProtoReader):
             # If selection is specified, return a copy
             return array.take(asel.indices, a_index)
 
+    def _read_next_timestep_or_none(self):
+        """copy next frame into timestep, ``None`` after the last frame"""
+        if self.ts.frame >= self.n_frames-1:
+            return None
+        return super(MemoryReader, self)._read_next_timestep_or_none()
+
     def _read_next_timestep(self, ts=None):
         """copy next frame into timestep"""
 
@@ -60,6 +60,9 @@ FLOAT_PATTERN = r"-?\d*\.?\d*(?:e[-+]?\d+)?"
 #: Regular expression for recognizing un/signed integers in a selection.
 INT_PATTERN = r"-?\d+"
 
+#: Regular expression for recognising wildcards in string selections.
+_WILDCARDS = re.compile(r"[*?\[]")
+
 #: Regular expression for recognising a range separator.
 #: Delimiters include ":", "-", "to" and can have arbitrary whitespace.
 RANGE_PATTERN = r"\s*(?:[:-]| to )\s*"
@@ -152,8 +155,69 @@ def join_separated_values(values):
             _values.append(v)
     return _values
 
+def isin_group(group, other):
+    """Boolean mask of the atoms in `group` that are also in `other`
+
+    Equivalent to ``np.isin(group.indices, other.indices)``, but looks the
+    indices up in a table spanning the universe instead of sorting both
+    arrays, which makes it linear in the size of the groups.
+
+    Parameters
+    ----------
+    group : AtomGroup
+        atoms to test
+    other : AtomGroup
+        atoms to test against, from the same universe as `group`
+
+    Returns
+    -------
+    mask : numpy.ndarray
+        boolean array of length ``len(group)``
+
+
+    .. versionadded:: 2.0.0
+    """
+    table = np.zeros(group.universe.atoms.n_atoms, dtype=bool)
+    table[other.indices] = True
+    return table[group.indices]
+
+
+def _unique_subset(group, idx):
+    """Sorted, unique :class:`AtomGroup` of the atoms at `idx` in `group`
+
+    `idx` may contain duplicates, as returned by
+    :func:`~MDAnalysis.lib.distances.capped_distance`. Sorting and
+    deduplicating the atom indices in a single pass avoids building an
+    intermediate group with duplicates and calling
+    :attr:`AtomGroup.unique` on it.
+    """
+    ix = unique_int_1d(group.ix[np.asarray(idx, dtype=np.intp)])
+    ag = group.universe.atoms[ix]
+    ag._cache['isunique'] = True
+    ag._cache['unique'] = ag
+    return ag
+
+
+def _isin_names(attr, names, ix):
+    """Boolean mask of the entries `ix` of a string TopologyAttr in `names`
+
+    The names are marked in a table over the values known to `attr`, which
+    is then indexed with the per-entry name indices.
+    """
+    table = np.zeros(len(attr.name_lookup), dtype=bool)
+    for name in names:
+        try:
+            table[attr.namedict[name]] = True
+        except KeyError:
+            pass
+    return table[attr.nmidx[ix]]
+
+
 _SELECTIONDICT = {}
 _OPERATIONS = {}
+# Parse trees of recently used selection strings, see SelectionParser.parse
+_PARSETREES = collections.OrderedDict()
+_PARSETREES_MAXSIZE = 1024
 # These are named args to select_atoms that have a special meaning and must
 # not be allowed as names for the 'group' keyword.
 _RESERVED_KWARGS=('updating',)
@@ -176,17 +240,38 @@ class LogicOperation(object, metaclass=_Operationmeta):
         self.rsel = rsel
         self.lsel = lsel
 
+    @property
+    def atomwise(self):
+        return self.lsel.atomwise and self.rsel.atomwise
+
 
 class AndOperation(LogicOperation):
     token = 'and'
     precedence = 3
 
     def apply(self, group):
+        # An atomwise selection only has to look at the atoms that passed
+        # the other side, which avoids evaluating it on the whole group.
+        if self.rsel.atomwise or self.lsel.atomwise:
+            if self.rsel.atomwise:
+                first, second = self.lsel, self.rsel
+            else:
+                first, second = self.rsel, self.lsel
+            sub = first.apply(group)
+            if not sub:
+                # still evaluate the other side, so that errors such as
+                # missing attributes do not depend on the operand order
+                second.apply(group)
+                return sub.unique
+            res = second.apply(sub)
+            # selections like global or bonded can reach outside of group
+            return res[isin_group(res, group)].unique
+
         rsel = self.rsel.apply(group)
         lsel = self.lsel.apply(group)
 
         # Mask which lsel indices appear in rsel
-        mask = np.in1d(rsel.indices, lsel.indices)
+        mask = isin_group(rsel, lsel)
         # and mask rsel according to that
         return rsel[mask].unique
 
@@ -225,14 +310,21 @@ class _Selectionmeta(type):
             _SELECTIONDICT[classdict['token'].lower()] = cls
         except KeyError:
             pass
+        else:
+            # a new keyword can change how strings are tokenized
+            _PARSETREES.clear()
 
 
 class Selection(object, metaclass=_Selectionmeta):
-    pass
+    #: ``True`` if atoms are selected based on their own properties only, so
+    #: that applying the selection to a subset of a group gives the same as
+    #: intersecting the subset with the selection applied to the whole group.
+    atomwise = False
 
 
 class AllSelection(Selection):
     token = 'all'
+    atomwise = True
 
     def __init__(self, parser, tokens):
         pass
@@ -257,9 +349,13 @@ class NotSelection(UnarySelection):
     token = 'not'
     precedence = 5
 
+    @property
+    def atomwise(self):
+        return self.sel.atomwise
+
     def apply(self, group):
         notsel = self.sel.apply(group)
-        return group[~np.in1d(group.indices, notsel.indices)].unique
+        return group[~isin_group(group, notsel)].unique
 
 
 class GlobalSelection(UnarySelection):
@@ -283,8 +379,11 @@ class ByResSelection(UnarySelection):
 
     def apply(self, group):
         res = self.sel.apply(group)
-        unique_res = unique_int_1d(res.resindices)
-        mask = np.in1d(group.resindices, unique_res)
+        # residue membership looked up in a table spanning the universe's
+        # residues, as in isin_group()
+        table = np.zeros(group.universe.residues.n_residues, dtype=bool)
+        table[res.resindices] = True
+        mask = table[group.resindices]
 
         return group[mask].unique
 
@@ -321,10 +420,9 @@ class AroundSelection(DistanceSelection):
 
     @return_empty_on_apply
     def apply(self, group):
-        indices = []
         sel = self.sel.apply(group)
         # All atoms in group that aren't in sel
-        sys = group[~np.in1d(group.indices, sel.indices)]
+        sys = group[~isin_group(group, sel)]
 
         if not sys or not sel:
             return sys[[]]
@@ -333,10 +431,7 @@ class AroundSelection(DistanceSelection):
         pairs = distances.capped_distance(sel.positions, sys.positions,
                                           self.cutoff, box=box,
                                           return_distances=False)
-        if pairs.size > 0:
-            indices = np.sort(pairs[:, 1])
-
-        return sys[np.asarray(indices, dtype=np.int64)].unique
+        return _unique_subset(sys, pairs[:, 1])
 
 class SphericalLayerSelection(DistanceSelection):
     token = 'sphlayer'
@@ -350,7 +445,6 @@ class SphericalLayerSelection(DistanceSelection):
 
     @return_empty_on_apply
     def apply(self, group):
-        indices = []
         sel = self.sel.apply(group)
         box = self.validate_dimensions(group.dimensions)
         periodic = box is not None
@@ -359,10 +453,7 @@ class SphericalLayerSelection(DistanceSelection):
                                           min_cutoff=self.inRadius,
                                           box=box,
                                           return_distances=False)
-        if pairs.size > 0:
-            indices = np.sort(pairs[:, 1])
-
-        return group[np.asarray(indices, dtype=np.int64)].unique
+        return _unique_subset(group, pairs[:, 1])
 
 
 class SphericalZoneSelection(DistanceSelection):
@@ -376,7 +467,6 @@ class SphericalZoneSelection(DistanceSelection):
 
     @return_empty_on_apply
     def apply(self, group):
-        indices = []
         sel = self.sel.apply(group)
         box = self.validate_dimensions(group.dimensions)
         periodic = box is not None
@@ -384,10 +474,7 @@ class SphericalZoneSelection(DistanceSelection):
         pairs = distances.capped_distance(ref, group.positions, self.cutoff,
                                           box=box,
                                           return_distances=False)
-        if pairs.size > 0:
-            indices = np.sort(pairs[:, 1])
-
-        return group[np.asarray(indices, dtype=np.int64)].unique
+        return _unique_subset(group, pairs[:, 1])
 
 
 class CylindricalSelection(Selection):
@@ -476,6 +563,7 @@ class CylindricalLayerSelection(CylindricalSelection):
 
 class PointSelection(DistanceSelection):
     token = 'point'
+    atomwise = True
 
     def __init__(self, parser, tokens):
         self.periodic = parser.periodic
@@ -487,19 +575,16 @@ class PointSelection(DistanceSelection):
 
     @return_empty_on_apply
     def apply(self, group):
-        indices = []
         box = self.validate_dimensions(group.dimensions)
         pairs = distances.capped_distance(self.ref[None, :], group.positions, self.cutoff,
                                           box=box,
                                           return_distances=False)
-        if pairs.size > 0:
-            indices = np.sort(pairs[:, 1])
-
-        return group[np.asarray(indices, dtype=np.int64)].unique
+        return _unique_subset(group, pairs[:, 1])
 
 
 class AtomSelection(Selection):
     token = 'atom'
+    atomwise = True
 
     def __init__(self, parser, tokens):
         self.segid = tokens.popleft()
@@ -524,29 +609,34 @@ class BondedSelection(Selection):
 
     def apply(self, group):
         grp = self.sel.apply(group)
+        try:
+            indptr, neighbors = group.universe._topology.bonds._csr
+        except AttributeError:
+            errmsg = "This Universe does not contain bonds information"
+            raise NoDataError(errmsg) from None
         # Check if we have bonds
-        if not group.bonds:
+        if not np.any(indptr[group.ix + 1] - indptr[group.ix]):
             warnings.warn("Bonded selection has 0 bonds")
             return group[[]]
 
-        grpidx = grp.indices
-
-        # (n, 2) array of bond indices
-        bix = np.array(group.bonds.to_indices())
+        # gather the bonded partners of every atom in grp
+        starts = indptr[grp.ix]
+        counts = indptr[grp.ix + 1] - starts
+        offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        partners = neighbors[offsets + np.arange(len(offsets))]
 
-        idx = []
-        # left side
-        idx.append(bix[:, 0][np.in1d(bix[:, 1], grpidx)])
-        # right side
-        idx.append(bix[:, 1][np.in1d(bix[:, 0], grpidx)])
+        # only follow bonds that belong to group, i.e. where either atom
+        # is a member of group
+        table = np.zeros(group.universe.atoms.n_atoms, dtype=bool)
+        table[group.ix] = True
+        keep = table[np.repeat(grp.ix, counts)] | table[partners]
 
-        idx = np.union1d(*idx)
-
-        return group.universe.atoms[np.unique(idx)]
+        return group.universe.atoms[unique_int_1d(partners[keep])]
 
 
 class SelgroupSelection(Selection):
     token = 'group'
+    atomwise = True
 
     def __init__(self, parser, tokens):
         grpname = tokens.popleft()
@@ -571,28 +661,42 @@ class _ProtoStringSelection(Selection):
     .. versionchanged:: 1.0.0
         Supports multiple wildcards, based on fnmatch
     """
+    atomwise = True
+
     def __init__(self, parser, tokens):
         vals = grab_not_keywords(tokens)
         if not vals:
             raise ValueError("Unexpected token '{0}'".format(tokens[0]))
 
         self.values = vals
+        # plain names are looked up directly, only wildcard patterns have to
+        # be matched against every known name
+        self._names = [val for val in vals if not _WILDCARDS.search(val)]
+        patterns = [fnmatch.translate(val) for val in vals
+                    if _WILDCARDS.search(val)]
+        self._pattern = re.compile('|'.join(patterns)) if patterns else None
 
     @return_empty_on_apply
     def apply(self, group):
         # rather than work on group.names, cheat and look at the lookup table
         nmattr = getattr(group.universe._topology, self.field)
 
-        matches = []  # list of passing indices
-        # iterate through set of known atom names, check which pass
-        for nm, ix in nmattr.namedict.items():
-            if any(fnmatch.fnmatchcase(nm, val) for val in self.values):
-                matches.append(ix)
+        # which of the known names pass
+        matches = np.zeros(len(nmattr.name_lookup), dtype=bool)
+        for val in self._names:
+            try:
+                matches[nmattr.namedict[val]] = True
+            except KeyError:
+                pass
+        if self._pattern is not None:
+            for nm, ix in nmattr.namedict.items():
+                if self._pattern.match(nm):
+                    matches[ix] = True
 
         # atomname indices for members of this group
         nmidx = nmattr.nmidx[getattr(group, self.level)]
 
-        return group[np.in1d(nmidx, matches)].unique
+        return group[matches[nmidx]].unique
 
 class AromaticSelection(Selection):
     """Select aromatic atoms.
@@ -601,6 +705,7 @@ class AromaticSelection(Selection):
     available through RDKit"""
     token = 'aromatic'
     field = 'aromaticities'
+    atomwise = True
 
     def __init__(self, parser, tokens):
         pass
@@ -672,6 +777,7 @@ class ResidSelection(Selection):
       resid 1:10
     """
     token = 'resid'
+    atomwise = True
 
     def __init__(self, parser, tokens):
         values = grab_not_keywords(tokens)
@@ -792,6 +898,7 @@ class ResidSelection(Selection):
 
 class BoolSelection(Selection):
     """Selection for boolean values"""
+    atomwise = True
 
     def __init__(self, parser, tokens):
         values = grab_not_keywords(tokens)
@@ -821,6 +928,7 @@ class BoolSelection(Selection):
 
 class RangeSelection(Selection):
     """Range selection for int values"""
+    atomwise = True
 
     value_offset = 0
     pattern = f"({INT_PATTERN}){RANGE_PATTERN}({INT_PATTERN})"
@@ -932,6 +1040,7 @@ class ProteinSelection(Selection):
        performance improved by ~100x on larger systems
     """
     token = 'protein'
+    atomwise = True
 
     prot_res = {
         # CHARMM top_all27_prot_lipid.rtf
@@ -962,14 +1071,9 @@ class ProteinSelection(Selection):
         pass
 
     def apply(self, group):
-        resname_attr = group.universe._topology.resnames
-        # which values in resname attr are in prot_res?
-        matches = [ix for (nm, ix) in resname_attr.namedict.items()
-                   if nm in self.prot_res]
-        # index of each atom's resname
-        nmidx = resname_attr.nmidx[group.resindices]
-        # intersect atom's resname index and matches to prot_res
-        return group[np.in1d(nmidx, matches)].unique
+        resnames = group.universe._topology.resnames
+        mask = _isin_names(resnames, self.prot_res, group.resindices)
+        return group[mask].unique
 
 
 class NucleicSelection(Selection):
@@ -989,6 +1093,7 @@ class NucleicSelection(Selection):
        performance improved by ~100x on larger systems
     """
     token = 'nucleic'
+    atomwise = True
 
     nucl_res = {
         'ADE', 'URA', 'CYT', 'GUA', 'THY', 'DA', 'DC', 'DG', 'DT', 'RA',
@@ -1004,12 +1109,7 @@ class NucleicSelection(Selection):
 
     def apply(self, group):
         resnames = group.universe._topology.resnames
-        nmidx = resnames.nmidx[group.resindices]
-
-        matches = [ix for (nm, ix) in resnames.namedict.items()
-                   if nm in self.nucl_res]
-        mask = np.in1d(nmidx, matches)
-
+        mask = _isin_names(resnames, self.nucl_res, group.resindices)
         return group[mask].unique
 
 
@@ -1032,16 +1132,11 @@ class BackboneSelection(ProteinSelection):
         resnames = group.universe._topology.resnames
 
         # filter by atom names
-        name_matches = [ix for (nm, ix) in atomnames.namedict.items()
-                        if nm in self.bb_atoms]
-        nmidx = atomnames.nmidx[group.ix]
-        group = group[np.in1d(nmidx, name_matches)]
+        group = group[_isin_names(atomnames, self.bb_atoms, group.ix)]
 
         # filter by resnames
-        resname_matches = [ix for (nm, ix) in resnames.namedict.items()
-                           if nm in self.prot_res]
-        nmidx = resnames.nmidx[group.resindices]
-        group = group[np.in1d(nmidx, resname_matches)]
+        group = group[_isin_names(resnames, self.prot_res,
+                                  group.resindices)]
 
         return group.unique
 
@@ -1065,16 +1160,11 @@ class NucleicBackboneSelection(NucleicSelection):
         resnames = group.universe._topology.resnames
 
         # filter by atom names
-        name_matches = [ix for (nm, ix) in atomnames.namedict.items()
-                        if nm in self.bb_atoms]
-        nmidx = atomnames.nmidx[group.ix]
-        group = group[np.in1d(nmidx, name_matches)]
+        group = group[_isin_names(atomnames, self.bb_atoms, group.ix)]
 
         # filter by resnames
-        resname_matches = [ix for (nm, ix) in resnames.namedict.items()
-                           if nm in self.nucl_res]
-        nmidx = resnames.nmidx[group.resindices]
-        group = group[np.in1d(nmidx, resname_matches)]
+        group = group[_isin_names(resnames, self.nucl_res,
+                                  group.resindices)]
 
         return group.unique
 
@@ -1103,16 +1193,11 @@ class BaseSelection(NucleicSelection):
         resnames = group.universe._topology.resnames
 
         # filter by atom names
-        name_matches = [ix for (nm, ix) in atomnames.namedict.items()
-                        if nm in self.base_atoms]
-        nmidx = atomnames.nmidx[group.ix]
-        group = group[np.in1d(nmidx, name_matches)]
+        group = group[_isin_names(atomnames, self.base_atoms, group.ix)]
 
         # filter by resnames
-        resname_matches = [ix for (nm, ix) in resnames.namedict.items()
-                           if nm in self.nucl_res]
-        nmidx = resnames.nmidx[group.resindices]
-        group = group[np.in1d(nmidx, resname_matches)]
+        group = group[_isin_names(resnames, self.nucl_res,
+                                  group.resindices)]
 
         return group.unique
 
@@ -1133,16 +1218,11 @@ class NucleicSugarSelection(NucleicSelection):
         resnames = group.universe._topology.resnames
 
         # filter by atom names
-        name_matches = [ix for (nm, ix) in atomnames.namedict.items()
-                        if nm in self.sug_atoms]
-        nmidx = atomnames.nmidx[group.ix]
-        group = group[np.in1d(nmidx, name_matches)]
+        group = group[_isin_names(atomnames, self.sug_atoms, group.ix)]
 
         # filter by resnames
-        resname_matches = [ix for (nm, ix) in resnames.namedict.items()
-                           if nm in self.nucl_res]
-        nmidx = resnames.nmidx[group.resindices]
-        group = group[np.in1d(nmidx, resname_matches)]
+        group = group[_isin_names(resnames, self.nucl_res,
+                                  group.resindices)]
 
         return group.unique
 
@@ -1157,6 +1237,7 @@ class PropertySelection(Selection):
         tolerance.
     """
     token = 'prop'
+    atomwise = True
     ops = dict([
         ('>', np.greater),
         ('<', np.less),
@@ -1247,7 +1328,16 @@ class PropertySelection(Selection):
 
     def apply(self, group):
         try:
-            values = getattr(group, self.props[self.prop])
+            col = {'x': 0, 'y': 1, 'z': 2}.get(self.prop)
+            if col is None:
+                values = getattr(group, self.props[self.prop])
+            elif group is group.universe.atoms:
+                # whole universe: compare on a view of the coordinates
+                values = group.universe.trajectory.ts.positions[:, col]
+            else:
+                # only gather the one coordinate that is compared
+                positions = group.universe.trajectory.ts.positions
+                values = positions[group.ix, col]
         except KeyError:
             errmsg = f"Expected one of {list(self.props.keys())}"
             raise SelectionError(errmsg) from None
@@ -1256,13 +1346,6 @@ class PropertySelection(Selection):
             errmsg = f"This Universe does not contain {attr} information"
             raise SelectionError(errmsg) from None
 
-        try:
-            col = {'x': 0, 'y': 1, 'z': 2}[self.prop]
-        except KeyError:
-            pass
-        else:
-            values = values[:, col]
-
         if self.absolute:
             values = np.abs(values)
         mask = self.operator(values, self.value)
@@ -1417,15 +1500,37 @@ class SelectionParser(object):
 
         .. versionchanged:: 2.0.0
             Added `atol` and `rtol` keywords to select float values.
+        .. versionchanged:: 2.0.0
+            Parse trees of selections without `selgroups` are cached and
+            reused for repeated selection strings.
         """
+        tokens = selectstr.replace('(', ' ( ').replace(')', ' ) ').split()
+        if selgroups:
+            # trees refer to the given groups and cannot be shared
+            return self._parse(tokens, selectstr, selgroups, periodic,
+                               atol, rtol)
+
+        key = (tuple(tokens), periodic, atol, rtol)
+        try:
+            parsetree = _PARSETREES[key]
+        except KeyError:
+            parsetree = self._parse(tokens, selectstr, selgroups, periodic,
+                                    atol, rtol)
+            _PARSETREES[key] = parsetree
+            if len(_PARSETREES) > _PARSETREES_MAXSIZE:
+                _PARSETREES.popitem(last=False)
+        else:
+            _PARSETREES.move_to_end(key)
+        return parsetree
+
+    def _parse(self, tokens, selectstr, selgroups, periodic, atol, rtol):
         self.periodic = periodic
         self.atol = atol
         self.rtol = rtol
 
         self.selectstr = selectstr
         self.selgroups = selgroups
-        tokens = selectstr.replace('(', ' ( ').replace(')', ' ) ')
-        self.tokens = collections.deque(tokens.split() + [None])
+        self.tokens = collections.deque(tokens + [None])
         parsetree = self.parse_expression(0)
         if self.tokens[0] is not None:
             raise SelectionError(
@@ -2330,11 +2330,9 @@ class _Connection(AtomAttr):
                 self.types.append(t)
                 self._guessed.append(g)
                 self.order.append(o)
-        # kill the old cache of bond Dict
-        try:
-            del self._cache['bd']
-        except KeyError:
-            pass
+        # kill the old caches of bond Dict and adjacency
+        self._cache.pop('bd', None)
+        self._cache.pop('csr', None)
 
     @_check_connection_values
     def _delete_bonds(self, values):
@@ -2359,11 +2357,9 @@ class _Connection(AtomAttr):
             arr = np.array(getattr(self, attr), dtype='object')
             new = np.delete(arr, idx)
             setattr(self, attr, list(new))
-        # kill the old cache of bond Dict
-        try:
-            del self._cache['bd']
-        except KeyError:
-            pass
+        # kill the old caches of bond Dict and adjacency
+        self._cache.pop('bd', None)
+        self._cache.pop('csr', None)
 
 
 class Bonds(_Connection):
@@ -2383,6 +2379,22 @@ class Bonds(_Connection):
     transplants = defaultdict(list)
     _n_atoms = 2
 
+    @property
+    @cached('csr')
+    def _csr(self):
+        """Lazily built compressed sparse row adjacency of bonded atoms
+
+        Returns ``(indptr, neighbors)``; the atoms bonded to the atom with
+        index ``i`` are ``neighbors[indptr[i]:indptr[i + 1]]``.
+        """
+        n_atoms = self.top.n_atoms
+        bix = np.array(self.values, dtype=np.intp).reshape(-1, 2)
+        src = np.concatenate([bix[:, 0], bix[:, 1]])
+        dst = np.concatenate([bix[:, 1], bix[:, 0]])
+        indptr = np.zeros(n_atoms + 1, dtype=np.intp)
+        np.cumsum(np.bincount(src, minlength=n_atoms), out=indptr[1:])
+        return indptr, dst[np.argsort(src, kind='stable')]
+
     def bonded_atoms(self):
         """An :class:`~MDAnalysis.core.groups.AtomGroup` of all
         :class:`Atoms<MDAnalysis.core.groups.Atom>` bonded to this
@@ -42,6 +42,9 @@ cdef extern from "calc_distances.h":
     void _calc_distance_array(coordinate* ref, int numref, coordinate* conf, int numconf, double* distances)
     void _calc_distance_array_ortho(coordinate* ref, int numref, coordinate* conf, int numconf, float* box, double* distances)
     void _calc_distance_array_triclinic(coordinate* ref, int numref, coordinate* conf, int numconf, float* box, double* distances)
+    void _calc_distance_array_sq(coordinate* ref, int numref, coordinate* conf, int numconf, double* distances)
+    void _calc_distance_array_sq_ortho(coordinate* ref, int numref, coordinate* conf, int numconf, float* box, double* distances)
+    void _calc_distance_array_sq_triclinic_prewrapped(coordinate* ref, int numref, coordinate* conf, int numconf, float* box, double* distances)
     void _calc_self_distance_array(coordinate* ref, int numref, double* distances)
     void _calc_self_distance_array_ortho(coordinate* ref, int numref, float* box, double* distances)
     void _calc_self_distance_array_triclinic(coordinate* ref, int numref, float* box, double* distances)
@@ -92,6 +95,41 @@ def calc_distance_array_triclinic(numpy.ndarray ref, numpy.ndarray conf,
                                    <coordinate*> conf.data, confnum,
                                    <float*> box.data, <double*> result.data)
 
+def calc_distance_array_sq(numpy.ndarray ref, numpy.ndarray conf,
+                           numpy.ndarray result):
+    cdef int confnum, refnum
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+
+    _calc_distance_array_sq(<coordinate*> ref.data, refnum,
+                            <coordinate*> conf.data, confnum,
+                            <double*> result.data)
+
+def calc_distance_array_sq_ortho(numpy.ndarray ref, numpy.ndarray conf,
+                                 numpy.ndarray box, numpy.ndarray result):
+    cdef int confnum, refnum
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+
+    _calc_distance_array_sq_ortho(<coordinate*> ref.data, refnum,
+                                  <coordinate*> conf.data, confnum,
+                                  <float*> box.data, <double*> result.data)
+
+def calc_distance_array_sq_triclinic_prewrapped(numpy.ndarray ref,
+                                                numpy.ndarray conf,
+                                                numpy.ndarray box,
+                                                numpy.ndarray result):
+    # ref and conf must already be wrapped into the box, see triclinic_pbc
+    cdef int confnum, refnum
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+
+    _calc_distance_array_sq_triclinic_prewrapped(<coordinate*> ref.data,
+                                                 refnum,
+                                                 <coordinate*> conf.data,
+                                                 confnum, <float*> box.data,
+                                                 <double*> result.data)
+
 def calc_self_distance_array(numpy.ndarray ref, numpy.ndarray result):
     cdef int refnum
     refnum = ref.shape[0]
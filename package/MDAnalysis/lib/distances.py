@@ -88,6 +88,10 @@ except ImportError:
     pass
 del importlib
 
+#: Maximum number of distances held in memory at once by the brute force
+#: capped distance search.
+_BRUTEFORCE_BLOCK_SIZE = 2**20
+
 def _run(funcname, args=None, kwargs=None, backend="serial"):
     """Helper function to select a backend function `funcname`."""
     args = args if args is not None else tuple()
@@ -524,16 +528,51 @@ def _bruteforce_capped(reference, configuration, max_cutoff, min_cutoff=None,
     distances = np.empty((0,), dtype=np.float64)
 
     if len(reference) > 0 and len(configuration) > 0:
-        _distances = distance_array(reference, configuration, box=box)
-        if min_cutoff is not None:
-            mask = np.where((_distances <= max_cutoff) & \
-                            (_distances > min_cutoff))
+        # Work through the reference in blocks of rows so that the distance
+        # matrix held in memory stays small, however many pairs are tested.
+        n_rows = max(1, _BRUTEFORCE_BLOCK_SIZE // len(configuration))
+        pair_blocks = []
+        distance_blocks = []
+        # Prepare the coordinates once rather than once per block. Squared
+        # distances are compared against squared cutoffs, and the square root
+        # is only taken of the distances that are returned.
+        kernel_args = ()
+        if box is None:
+            kernel = "calc_distance_array_sq"
         else:
-            mask = np.where((_distances <= max_cutoff))
-        if mask[0].size > 0:
-            pairs = np.c_[mask[0], mask[1]]
+            boxtype, box = check_box(box)
+            kernel_args = (box,)
+            if boxtype == 'ortho':
+                kernel = "calc_distance_array_sq_ortho"
+            else:
+                kernel = "calc_distance_array_sq_triclinic_prewrapped"
+                # wrapping is done in place, don't touch the input arrays
+                reference = reference.copy()
+                configuration = configuration.copy()
+                _run("triclinic_pbc", args=(reference, box))
+                _run("triclinic_pbc", args=(configuration, box))
+        max_cutoff = max_cutoff**2
+        if min_cutoff is not None:
+            min_cutoff = min_cutoff**2
+        for start in range(0, len(reference), n_rows):
+            ref = reference[start:start + n_rows]
+            _distances = np.empty((len(ref), len(configuration)),
+                                  dtype=np.float64)
+            _run(kernel, args=(ref, configuration) + kernel_args +
+                 (_distances,))
+            if min_cutoff is not None:
+                mask = np.where((_distances <= max_cutoff) & \
+                                (_distances > min_cutoff))
+            else:
+                mask = np.where((_distances <= max_cutoff))
+            if mask[0].size > 0:
+                pair_blocks.append(np.c_[mask[0] + start, mask[1]])
+                if return_distances:
+                    distance_blocks.append(np.sqrt(_distances[mask]))
+        if pair_blocks:
+            pairs = np.concatenate(pair_blocks)
             if return_distances:
-                distances = _distances[mask]
+                distances = np.concatenate(distance_blocks)
 
     if return_distances:
         return pairs, distances
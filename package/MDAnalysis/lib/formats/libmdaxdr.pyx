@@ -51,6 +51,13 @@ arbitrary frames using the :meth:`~XTCFile.seek` method. This is provided by
 lazily generating a offset list for stored frames. The offset list is generated
 the first time :func:`len` or :`~XTCFile.seek` is called.
 
+The XDR library is called without holding the global interpreter lock, so
+frames can be decoded (or encoded) in a background thread while the main
+thread keeps working on previously read frames. A single file object must
+still only be used by one thread at a time; reading, writing, seeking or
+closing a file while another thread is decoding from it raises a
+:exc:`RuntimeError`.
+
 (For more details on how to use :class:`XTCFile` and :class:`TRRFile` on their
 own please see the source code in `lib/formats/libmdaxdr.pyx`_ for the time being.)
 
@@ -83,18 +90,18 @@ cdef extern from 'include/xdrfile.h':
 cdef extern from 'include/xdrfile_xtc.h':
     int read_xtc_natoms(char * fname, int * natoms)
     int read_xtc(XDRFILE * xfp, int natoms, int * step, float * time, matrix box,
-                 rvec * x, float * prec)
+                 rvec * x, float * prec) nogil
     int write_xtc(XDRFILE * xfp, int natoms, int step, float time, matrix box,
-                  rvec * x, float prec)
+                  rvec * x, float prec) nogil
 
 
 
 cdef extern from 'include/xdrfile_trr.h':
     int read_trr_natoms(char *fname, int *natoms)
     int read_trr(XDRFILE *xfp, int natoms, int *step, float *time, float *_lambda,
-                 matrix box, rvec *x, rvec *v, rvec *f, int *has_prop)
+                 matrix box, rvec *x, rvec *v, rvec *f, int *has_prop) nogil
     int write_trr(XDRFILE *xfp, int natoms, int step, float time, float _lambda,
-                  matrix box, rvec *x, rvec *v, rvec *f)
+                  matrix box, rvec *x, rvec *v, rvec *f) nogil
 
 
 cdef extern from 'include/xtc_seek.h':
@@ -172,12 +179,30 @@ cdef class _XDRFile:
     cdef np.ndarray box
     cdef np.ndarray _offsets
     cdef readonly int _has_offsets
+    cdef int in_use
 
     def __cinit__(self, fname, mode='r'):
         self.fname = fname.encode('utf-8')
         self.is_open = False
+        self.in_use = False
         self.open(self.fname, mode)
 
+    cdef int _check_not_in_use(self) except -1:
+        if self.in_use:
+            raise RuntimeError('XDR file {} is in use by another '
+                               'thread'.format(self.fname))
+        return 0
+
+    cdef int _acquire(self) except -1:
+        """Mark the file as in use while the XDR library runs without the GIL
+
+        The flag is only read and written while holding the GIL, so checking
+        and setting it cannot race between threads.
+        """
+        self._check_not_in_use()
+        self.in_use = True
+        return 0
+
     def __dealloc__(self):
         self.close()
 
@@ -187,7 +212,10 @@ cdef class _XDRFile:
         Raises
         ------
         IOError
+        RuntimeError
+            if another thread is reading from or writing to the file
         """
+        self._check_not_in_use()
         res = 1
         if self.is_open:
             res = xdrfile_close(self.xfp)
@@ -215,6 +243,7 @@ cdef class _XDRFile:
         ------
         IOError
         """
+        self._check_not_in_use()
         if self.is_open:
             self.close()
         self.fname = fname
@@ -338,6 +367,7 @@ cdef class _XDRFile:
         IOError
         """
         cdef int64_t offset
+        self._check_not_in_use()
         if frame == 0:
             offset = 0
         elif frame < 0:
@@ -393,6 +423,7 @@ cdef class _XDRFile:
             raise IOError("Parameter 'whence' must be "
                           "one of {}".format(tuple(_whence_vals.keys())))
         offst = offset
+        self._check_not_in_use()
         self.reached_eof = False
         ok = xdr_seek(self.xfp, offst, whn)
         if ok != EOK:
@@ -507,7 +538,7 @@ cdef class TRRFile(_XDRFile):
             raise IOError('File opened in mode: {}. Reading only allow '
                                'in mode "r"'.format('self.mode'))
 
-        return_code = 1
+        cdef int return_code = 1
         cdef int step = 0
         cdef int has_prop = 0
         cdef float time = 0
@@ -519,13 +550,23 @@ cdef class TRRFile(_XDRFile):
         cdef np.ndarray velocity = np.empty((self.n_atoms, DIMS), dtype=DTYPE)
         cdef np.ndarray forces = np.empty((self.n_atoms, DIMS), dtype=DTYPE)
         cdef np.ndarray box = np.empty((DIMS, DIMS), dtype=DTYPE)
+        cdef float* box_ptr = <float*>box.data
+        cdef float* xyz_ptr = <float*>xyz.data
+        cdef float* velocity_ptr = <float*>velocity.data
+        cdef float* forces_ptr = <float*>forces.data
 
-        return_code = read_trr(self.xfp, self.n_atoms, <int*> &step,
-                                      &time, &lmbda, <matrix>box.data,
-                                      <rvec*>xyz.data,
-                                      <rvec*>velocity.data,
-                                      <rvec*>forces.data,
-                                      <int*> &has_prop)
+        # decoding doesn't touch Python objects, let other threads run
+        self._acquire()
+        try:
+            with nogil:
+                return_code = read_trr(self.xfp, self.n_atoms, <int*> &step,
+                                       &time, &lmbda, <matrix>box_ptr,
+                                       <rvec*>xyz_ptr,
+                                       <rvec*>velocity_ptr,
+                                       <rvec*>forces_ptr,
+                                       <int*> &has_prop)
+        finally:
+            self.in_use = False
         # trr are a bit weird. Reading after the last frame always always
         # results in an integer error while reading. I tried it also with trr
         # produced by different codes (Gromacs, ...).
@@ -631,11 +672,17 @@ cdef class TRRFile(_XDRFile):
                               'are trying to write {} atoms.'.format(
                                   self.n_atoms, forces.shape[0]))
 
-        return_code = write_trr(self.xfp, self.n_atoms, step, time,
-                                _lambda, <matrix> box_ptr,
-                                <rvec*> xyz_ptr,
-                                <rvec*> velocity_ptr,
-                                <rvec*> forces_ptr)
+        cdef int return_code
+        self._acquire()
+        try:
+            with nogil:
+                return_code = write_trr(self.xfp, self.n_atoms, step, time,
+                                        _lambda, <matrix> box_ptr,
+                                        <rvec*> xyz_ptr,
+                                        <rvec*> velocity_ptr,
+                                        <rvec*> forces_ptr)
+        finally:
+            self.in_use = False
         if return_code != EOK:
             raise IOError('TRR write error = {}'.format(
                 error_message[return_code]))
@@ -725,16 +772,24 @@ cdef class XTCFile(_XDRFile):
             raise IOError('File opened in mode: {}. Reading only allow '
                                'in mode "r"'.format('self.mode'))
 
-        return_code = 1
+        cdef int return_code = 1
         cdef int step
         cdef float time, prec
 
         cdef np.ndarray xyz = np.empty((self.n_atoms, DIMS), dtype=DTYPE)
         cdef np.ndarray box = np.empty((DIMS, DIMS), dtype=DTYPE)
+        cdef float* box_ptr = <float*>box.data
+        cdef float* xyz_ptr = <float*>xyz.data
 
-        return_code = read_xtc(self.xfp, self.n_atoms, <int*> &step,
-                                      &time, <matrix>box.data,
-                                      <rvec*>xyz.data, <float*> &prec)
+        # decoding doesn't touch Python objects, let other threads run
+        self._acquire()
+        try:
+            with nogil:
+                return_code = read_xtc(self.xfp, self.n_atoms, <int*> &step,
+                                       &time, <matrix>box_ptr,
+                                       <rvec*>xyz_ptr, <float*> &prec)
+        finally:
+            self.in_use = False
         if return_code != EOK and return_code != EENDOFFILE:
             raise IOError('XTC read error = {}'.format(
                 error_message[return_code]))
@@ -747,6 +802,154 @@ cdef class XTCFile(_XDRFile):
             self.current_frame += 1
         return XTCFrame(xyz, box, step, time, prec)
 
+    def read_direct_x(self, positions):
+        """Read next frame in the XTC file, decoding coordinates into `positions`
+
+        Compared to :meth:`read` this skips allocating a new coordinate array
+        for every frame, e.g. when reading straight into the positions of a
+        :class:`~MDAnalysis.coordinates.base.Timestep`.
+
+        Parameters
+        ----------
+        positions : numpy.ndarray, shape=(`n_atoms`, 3), dtype=numpy.float32
+            C-contiguous array that receives the coordinates
+
+        Returns
+        -------
+        frame : libmdaxdr.XTCFrame
+            namedtuple with frame information, ``frame.x`` is `positions`
+
+        See Also
+        --------
+        read
+
+        Raises
+        ------
+        IOError
+        ValueError
+            if `positions` has the wrong shape, dtype or memory layout
+
+
+        .. versionadded:: 2.0.0
+        """
+        if self.reached_eof:
+            raise EOFError('Reached last frame in XTC, seek to 0')
+        if not self.is_open:
+            raise IOError('No file opened')
+        if self.mode != 'r':
+            raise IOError('File opened in mode: {}. Reading only allow '
+                               'in mode "r"'.format('self.mode'))
+
+        cdef DTYPE_T[:, ::1] xyz_view = positions
+        if xyz_view.shape[0] != self.n_atoms or xyz_view.shape[1] != DIMS:
+            raise ValueError('positions must have shape ({}, {})'.format(
+                self.n_atoms, DIMS))
+
+        cdef int return_code = 1
+        cdef int step
+        cdef float time, prec
+
+        cdef np.ndarray box = np.empty((DIMS, DIMS), dtype=DTYPE)
+        cdef float* box_ptr = <float*>box.data
+        cdef float* xyz_ptr = &xyz_view[0, 0]
+
+        self._acquire()
+        try:
+            with nogil:
+                return_code = read_xtc(self.xfp, self.n_atoms, <int*> &step,
+                                       &time, <matrix>box_ptr,
+                                       <rvec*>xyz_ptr, <float*> &prec)
+        finally:
+            self.in_use = False
+        if return_code != EOK and return_code != EENDOFFILE:
+            raise IOError('XTC read error = {}'.format(
+                error_message[return_code]))
+
+        if return_code == EENDOFFILE:
+            self.reached_eof = True
+            raise StopIteration
+
+        self.current_frame += 1
+        return XTCFrame(positions, box, step, time, prec)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def read_chunk(self, DTYPE_T[:, :, ::1] xyz, DTYPE_T[:, :, ::1] box,
+                   int[::1] step, DTYPE_T[::1] time):
+        """Read up to ``len(xyz)`` consecutive frames into the given arrays
+
+        All frames are decoded in a single call, without creating Python
+        objects for every frame. This is useful for consumers that only need
+        the coordinates of many frames, e.g. to compute averages.
+
+        Parameters
+        ----------
+        xyz : numpy.ndarray, shape=(n, `n_atoms`, 3), dtype=numpy.float32
+            C-contiguous output array for the coordinates
+        box : numpy.ndarray, shape=(n, 3, 3), dtype=numpy.float32
+            C-contiguous output array for the box vectors
+        step : numpy.ndarray, shape=(n,), dtype=numpy.int32
+            output array for the step numbers
+        time : numpy.ndarray, shape=(n,), dtype=numpy.float32
+            output array for the times
+
+        Returns
+        -------
+        n_read : int
+            number of frames read. Only the first `n_read` entries of the
+            output arrays are valid. Less than ``n`` frames are read when the
+            end of the file is reached.
+
+        Raises
+        ------
+        IOError
+        ValueError
+            if the shapes of the output arrays don't match
+
+
+        .. versionadded:: 2.0.0
+        """
+        if self.reached_eof:
+            raise EOFError('Reached last frame in XTC, seek to 0')
+        if not self.is_open:
+            raise IOError('No file opened')
+        if self.mode != 'r':
+            raise IOError('File opened in mode: {}. Reading only allow '
+                               'in mode "r"'.format('self.mode'))
+
+        cdef int n = xyz.shape[0]
+        if (xyz.shape[1] != self.n_atoms or xyz.shape[2] != DIMS or
+                box.shape[0] < n or box.shape[1] != DIMS or
+                box.shape[2] != DIMS or step.shape[0] < n or
+                time.shape[0] < n):
+            raise ValueError('Output arrays must hold {} frames of {} atoms'
+                             ''.format(n, self.n_atoms))
+
+        cdef int n_read = 0
+        cdef int return_code = EOK
+        cdef float prec
+        self._acquire()
+        try:
+            with nogil:
+                while n_read < n:
+                    return_code = read_xtc(self.xfp, self.n_atoms,
+                                           &step[n_read], &time[n_read],
+                                           <matrix>&box[n_read, 0, 0],
+                                           <rvec*>&xyz[n_read, 0, 0], &prec)
+                    if return_code != EOK:
+                        break
+                    n_read += 1
+        finally:
+            self.in_use = False
+        self.current_frame += n_read
+
+        if return_code != EOK:
+            if return_code != EENDOFFILE:
+                raise IOError('XTC read error = {}'.format(
+                    error_message[return_code]))
+            self.reached_eof = True
+        return n_read
+
     def write(self, xyz, box, int step, float time, float precision=1000):
         """write one frame to the XTC file
 
@@ -799,9 +1002,17 @@ cdef class XTCFile(_XDRFile):
                               'are trying to use {}'.format(
                                   self.precision, precision))
 
-        return_code = write_xtc(self.xfp, self.n_atoms, step, time,
-                                       <matrix>&box_view[0, 0],
-                                       <rvec*>&xyz_view[0, 0], precision)
+        cdef float* box_ptr = &box_view[0, 0]
+        cdef float* xyz_ptr = &xyz_view[0, 0]
+        cdef int return_code
+        self._acquire()
+        try:
+            with nogil:
+                return_code = write_xtc(self.xfp, self.n_atoms, step, time,
+                                        <matrix>box_ptr,
+                                        <rvec*>xyz_ptr, precision)
+        finally:
+            self.in_use = False
         if return_code != EOK:
             raise IOError('XTC write error = {}'.format(
                 error_message[return_code]))
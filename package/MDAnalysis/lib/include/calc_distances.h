@@ -431,6 +431,79 @@ static void _calc_distance_array_triclinic(coordinate* ref, int numref,
   }
 }
 
+static void _calc_distance_array_sq(coordinate* ref, int numref,
+                                    coordinate* conf, int numconf,
+                                    double* distances)
+{
+  int i, j;
+  double dx[3];
+
+#ifdef PARALLEL
+#pragma omp parallel for private(i, j, dx) shared(distances)
+#endif
+  for (i=0; i<numref; i++) {
+    for (j=0; j<numconf; j++) {
+      dx[0] = conf[j][0] - ref[i][0];
+      dx[1] = conf[j][1] - ref[i][1];
+      dx[2] = conf[j][2] - ref[i][2];
+      *(distances+i*numconf+j) = (dx[0]*dx[0]) + (dx[1]*dx[1]) + (dx[2]*dx[2]);
+    }
+  }
+}
+
+static void _calc_distance_array_sq_ortho(coordinate* ref, int numref,
+                                          coordinate* conf, int numconf,
+                                          float* box, double* distances)
+{
+  int i, j;
+  double dx[3];
+  float inverse_box[3];
+
+  inverse_box[0] = 1.0 / box[0];
+  inverse_box[1] = 1.0 / box[1];
+  inverse_box[2] = 1.0 / box[2];
+#ifdef PARALLEL
+#pragma omp parallel for private(i, j, dx) shared(distances)
+#endif
+  for (i=0; i<numref; i++) {
+    for (j=0; j<numconf; j++) {
+      dx[0] = conf[j][0] - ref[i][0];
+      dx[1] = conf[j][1] - ref[i][1];
+      dx[2] = conf[j][2] - ref[i][2];
+      // Periodic boundaries
+      minimum_image(dx, box, inverse_box);
+      *(distances+i*numconf+j) = (dx[0]*dx[0]) + (dx[1]*dx[1]) + (dx[2]*dx[2]);
+    }
+  }
+}
+
+static void _calc_distance_array_sq_triclinic_prewrapped(coordinate* ref,
+                                                        int numref,
+                                                        coordinate* conf,
+                                                        int numconf,
+                                                        float* box,
+                                                        double* distances)
+{
+  // Unlike _calc_distance_array_triclinic, the coordinates must already be
+  // inside the box (see _triclinic_pbc), so that callers working in blocks
+  // only have to wrap them once.
+  int i, j;
+  double dx[3];
+
+#ifdef PARALLEL
+#pragma omp parallel for private(i, j, dx) shared(distances)
+#endif
+  for (i=0; i<numref; i++){
+    for (j=0; j<numconf; j++){
+      dx[0] = conf[j][0] - ref[i][0];
+      dx[1] = conf[j][1] - ref[i][1];
+      dx[2] = conf[j][2] - ref[i][2];
+      minimum_image_triclinic(dx, box);
+      *(distances + i*numconf + j) = (dx[0]*dx[0] + dx[1]*dx[1] + dx[2]*dx[2]);
+    }
+  }
+}
+
 static void _calc_self_distance_array(coordinate* ref, int numref,
                                       double* distances)
 {
@@ -225,6 +225,11 @@ def sarrus_det(matrix):
     return _sarrus_det_multiple(m.reshape((-1, 3, 3))).reshape(shape[:-2])
 
 
+# index pairs of the box vectors enclosing the angles alpha, beta, gamma
+_ANGLE_ROWS = np.array([1, 0, 0])
+_ANGLE_COLS = np.array([2, 2, 1])
+
+
 def triclinic_box(x, y, z):
     """Convert the three triclinic box vectors to
     ``[lx, ly, lz, alpha, beta, gamma]``.
@@ -269,19 +274,24 @@ def triclinic_box(x, y, z):
     .. versionchanged:: 0.20.0
        Calculations are performed in double precision and invalid box vectors
        result in an all-zero box.
+    .. versionchanged:: 2.0.0
+       Box lengths and angles are computed from the Gram matrix of the box
+       vectors in a single vectorized pass.
     """
-    x = np.asarray(x, dtype=np.float64)
-    y = np.asarray(y, dtype=np.float64)
-    z = np.asarray(z, dtype=np.float64)
-    lx = norm(x)
-    ly = norm(y)
-    lz = norm(z)
-    alpha = np.rad2deg(np.arccos(np.dot(y, z) / (ly * lz)))
-    beta = np.rad2deg(np.arccos(np.dot(x, z) / (lx * lz)))
-    gamma = np.rad2deg(np.arccos(np.dot(x, y) / (lx * ly)))
-    box = np.array([lx, ly, lz, alpha, beta, gamma], dtype=np.float32)
+    vecs = np.array([x, y, z], dtype=np.float64)
+    # The Gram matrix holds all pairwise dot products of the box vectors:
+    # squared lengths on the diagonal, the products required for
+    # (alpha, beta, gamma) = (angle(y, z), angle(x, z), angle(x, y)) off it.
+    gram = np.dot(vecs, vecs.T)
+    lengths = np.sqrt(gram.diagonal())
+    cosines = (gram[_ANGLE_ROWS, _ANGLE_COLS] /
+               (lengths[_ANGLE_ROWS] * lengths[_ANGLE_COLS]))
+    angles = np.rad2deg(np.arccos(cosines))
+    box = np.empty(6, dtype=np.float32)
+    box[:3] = lengths
+    box[3:] = angles
     # Only positive edge lengths and angles in (0, 180) are allowed:
-    if np.all(box > 0.0) and alpha < 180.0 and beta < 180.0 and gamma < 180.0:
+    if (box > 0.0).all() and (angles < 180.0).all():
         return box
     # invalid box, return zero vector:
     return np.zeros(6, dtype=np.float32)
@@ -811,6 +811,17 @@ class BaseTimestepTest(object):
         with pytest.raises(NoDataError):
             getattr(ts, 'velocities')
 
+    @pytest.mark.parametrize('attr', ['velocities', 'forces'])
+    def test_reenable_reuses_buffer(self, attr):
+        ts = self.Timestep(10, **{attr: True})
+        setattr(ts, attr, self.refvel)
+        buf = getattr(ts, attr)
+
+        setattr(ts, 'has_' + attr, False)
+        setattr(ts, 'has_' + attr, True)
+        assert getattr(ts, attr) is buf
+        assert_equal(getattr(ts, attr), np.zeros((10, 3)))
+
     def test_forces_remove(self):
         ts = self.Timestep(10, forces=True)
         ts.frame += 1
@@ -1071,6 +1082,25 @@ class BaseTimestepTest(object):
 
         assert_timestep_almost_equal(ts, ts2)
 
+    def test_copy_into(self, some_ts):
+        ts = some_ts
+        dst = self.Timestep(self.size, positions=True, velocities=True,
+                            forces=True)
+        buffers = (dst._pos, dst._velocities, dst._forces)
+        ts.copy_into(dst)
+
+        assert_timestep_almost_equal(ts, dst)
+        # existing arrays are overwritten instead of replaced
+        for has, buf, new in zip(
+                (ts.has_positions, ts.has_velocities, ts.has_forces),
+                buffers, (dst._pos, dst._velocities, dst._forces)):
+            if has:
+                assert new is buf
+
+    def test_copy_into_wrong_size(self, some_ts):
+        with pytest.raises(ValueError):
+            some_ts.copy_into(self.Timestep(self.size + 1))
+
     def _get_pos(self):
         # Get generic reference positions
         return np.arange(30).reshape(10, 3) * 1.234
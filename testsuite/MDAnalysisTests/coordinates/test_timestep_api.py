@@ -27,7 +27,7 @@
 _TestTimestepInterface tests the Readers are correctly using Timesteps
 """
 import numpy as np
-from numpy.testing import assert_equal
+from numpy.testing import assert_equal, assert_allclose
 
 import MDAnalysis as mda
 from MDAnalysisTests.datafiles import (PSF, XYZ_five, INPCRD, DCD, DLP_CONFIG,
@@ -135,3 +135,24 @@ def test_atomgroup_dims_access(uni):
     assert_equal(dims, ts.dimensions)
     # but not identical
     assert dims is not ts.dimensions
+
+
+@pytest.mark.parametrize('otherTS', [
+    mda.coordinates.DLPoly.Timestep,
+    mda.coordinates.FHIAIMS.Timestep,
+    mda.coordinates.GRO.Timestep,
+    mda.coordinates.H5MD.Timestep,
+    mda.coordinates.TRZ.Timestep,
+])
+def test_cached_dimensions_follow_unitcell(otherTS):
+    # Timesteps storing box vectors cache the converted dimensions
+    ts = otherTS(10)
+    ts.dimensions = [10., 11., 12., 80., 85., 95.]
+    dims = ts.dimensions
+    assert_allclose(dims, [10., 11., 12., 80., 85., 95.], rtol=1e-5)
+    # modifying the returned array must not alter the cached value
+    dims[:] = 0
+    assert_allclose(ts.dimensions, [10., 11., 12., 80., 85., 95.], rtol=1e-5)
+    # in-place changes to the native unitcell invalidate the cache
+    ts._unitcell *= 2
+    assert_allclose(ts.dimensions, [20., 22., 24., 80., 85., 95.], rtol=1e-5)
@@ -24,6 +24,7 @@ import pytest
 from unittest.mock import patch
 
 import errno
+import gc
 import numpy as np
 import os
 import shutil
@@ -42,6 +43,7 @@ from MDAnalysisTests.coordinates.base import (MultiframeReaderTest,
 import MDAnalysis as mda
 from MDAnalysis.coordinates.base import Timestep
 from MDAnalysis.coordinates import XDR
+from MDAnalysis.lib.formats.libmdaxdr import XTCFile
 
 
 class _XDRReader_Sub(object):
@@ -215,6 +217,131 @@ class TestXTCReader(_GromacsReader):
     filename = XTC
 
 
+@pytest.mark.parametrize('chunksize', [1, 4, 10, 64])
+def test_xtc_iter_chunks(chunksize):
+    u = mda.Universe(GRO, XTC)
+    ref = np.array([ts.positions.copy() for ts in u.trajectory])
+    chunks = [c.copy() for c in u.trajectory.iter_chunks(chunksize)]
+    assert all(len(c) <= chunksize for c in chunks)
+    assert_almost_equal(np.concatenate(chunks), ref)
+    # the reader itself does not move
+    assert u.trajectory.ts.frame == 0
+
+
+def test_xtc_iter_chunks_partial():
+    u = mda.Universe(GRO, XTC)
+    ref = np.array([ts.positions.copy() for ts in u.trajectory])
+    u.trajectory[3]
+    it = u.trajectory.iter_chunks(2)
+    assert_almost_equal(next(it), ref[:2])
+    assert u.trajectory.ts.frame == 3
+    # random access between chunks neither disturbs the iteration nor is
+    # disturbed by it
+    u.trajectory[7]
+    assert_almost_equal(next(it), ref[2:4])
+    assert_almost_equal(next(u.trajectory).positions, ref[8])
+    del it
+    gc.collect()
+    assert u.trajectory.ts.frame == 8
+    assert_almost_equal(next(u.trajectory).positions, ref[9])
+
+
+def test_xtc_decodes_into_positions():
+    u = mda.Universe(GRO, XTC)
+    pos = u.trajectory.ts._pos
+    with XTCFile(XTC) as xtc:
+        ref = [frame.x * 10 for frame in xtc]
+    for i in range(3):
+        u.trajectory[i]
+        assert u.trajectory.ts._pos is pos
+        assert_almost_equal(u.trajectory.ts.positions, ref[i], decimal=5)
+
+
+def test_xtc_iter_end_without_read():
+    u = mda.Universe(GRO, XTC)
+    u.trajectory[-1]
+    with patch.object(u.trajectory, '_read_next_timestep') as read:
+        assert u.trajectory._read_next_timestep_or_none() is None
+    read.assert_not_called()
+
+
+@pytest.mark.parametrize('start, stop, step', [
+    (None, None, None), (2, 8, 3), (7, 1, -2), (4, 4, 1)])
+def test_xtc_timeseries(start, stop, step):
+    u = mda.Universe(GRO, XTC)
+    ref = [ts.positions.copy() for ts in u.trajectory[start:stop:step]]
+    u.trajectory[3]
+    xyz = u.trajectory.timeseries(start=start, stop=stop, step=step,
+                                  order='fac')
+    assert xyz.shape == (len(ref), u.atoms.n_atoms, 3)
+    for x, r in zip(xyz, ref):
+        assert_almost_equal(x, r)
+    # the reader still continues from the current frame
+    assert u.trajectory.next().frame == 4
+
+
+def test_xtc_timeseries_atomindices():
+    u = mda.Universe(GRO, XTC)
+    allframes = u.trajectory.timeseries(order='afc')
+    indices = [9, 4, 2, 0, 50]
+    xyz = u.trajectory.timeseries(asel=u.atoms[indices], order='afc')
+    assert xyz.shape == (len(indices), u.trajectory.n_frames, 3)
+    assert_almost_equal(xyz, allframes[indices])
+
+
+def test_xtc_timeseries_empty_selection():
+    u = mda.Universe(GRO, XTC)
+    with pytest.raises(mda.NoDataError):
+        u.trajectory.timeseries(asel=u.atoms[[]])
+
+
+def test_xtc_write_frame(tmpdir):
+    u = mda.Universe(GRO, XTC)
+    outfile = str(tmpdir.join('write_frame.xtc'))
+    with mda.Writer(outfile, u.atoms.n_atoms) as w:
+        for ts in u.trajectory:
+            w.write_frame(ts.positions, ts.dimensions, ts.frame, ts.time)
+    u2 = mda.Universe(GRO, outfile)
+    assert len(u2.trajectory) == len(u.trajectory)
+    for ts, ts2 in zip(u.trajectory, u2.trajectory):
+        assert_almost_equal(ts2.positions, ts.positions, decimal=2)
+        assert_almost_equal(ts2.dimensions, ts.dimensions, decimal=4)
+        assert_almost_equal(ts2.time, ts.time, decimal=4)
+        assert ts2.data['step'] == ts.frame
+
+
+def test_xtc_write_frame_lists(tmpdir):
+    outfile = str(tmpdir.join('write_frame.xtc'))
+    positions = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+    with mda.Writer(outfile, 2) as w:
+        w.write_frame(positions, [50, 50, 50, 90, 90, 90])
+    with mda.coordinates.XTC.XTCReader(outfile) as r:
+        assert_almost_equal(r.ts.positions, positions, decimal=3)
+        assert_almost_equal(r.ts.dimensions, [50, 50, 50, 90, 90, 90],
+                            decimal=4)
+
+
+def test_xtc_write_frame_wrong_n_atoms(tmpdir):
+    outfile = str(tmpdir.join('write_frame.xtc'))
+    with mda.Writer(outfile, 10) as w:
+        with pytest.raises(ValueError):
+            w.write_frame(np.zeros((5, 3), dtype=np.float32),
+                          np.array([10, 10, 10, 90, 90, 90], dtype=np.float32))
+
+
+@pytest.mark.parametrize('positions, dimensions', [
+    (np.zeros((10, 2), dtype=np.float32), [10, 10, 10, 90, 90, 90]),
+    (np.zeros((10, 4), dtype=np.float32), [10, 10, 10, 90, 90, 90]),
+    (np.zeros(30, dtype=np.float32), [10, 10, 10, 90, 90, 90]),
+    (np.zeros((10, 3), dtype=np.float32), [10, 10, 10]),
+])
+def test_xtc_write_frame_wrong_shape(tmpdir, positions, dimensions):
+    outfile = str(tmpdir.join('write_frame.xtc'))
+    with mda.Writer(outfile, 10) as w:
+        with pytest.raises(ValueError):
+            w.write_frame(positions, dimensions)
+
+
 class TestXTCReaderClass(object):
     def test_with_statement(self):
         from MDAnalysis.coordinates.XTC import XTCReader
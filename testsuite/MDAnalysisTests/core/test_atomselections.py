@@ -24,6 +24,7 @@ import os
 import textwrap
 from io import StringIO
 import itertools
+import fnmatch
 import numpy as np
 from numpy.testing import(
     assert_equal,
@@ -927,6 +928,17 @@ class TestPropSelection(object):
 
         assert_equal(set(ref.indices), set(sel.indices))
 
+    @pytest.mark.parametrize('prop', ['x', 'y', 'z'])
+    @pytest.mark.parametrize('ix', [None, [10, 5, 3, 8, 0]])
+    def test_coordinate(self, prop, ix):
+        u = mda.Universe(PSF, DCD)
+        ag = u.atoms if ix is None else u.atoms[ix]
+        col = 'xyz'.index(prop)
+        sel = ag.select_atoms(f'prop abs {prop} > 5.0')
+        ref = ag[np.abs(ag.positions[:, col]) > 5.0].unique
+        assert len(sel) > 0
+        assert_equal(sel.indices, ref.indices)
+
 
 class TestBondedSelection(object):
     @pytest.fixture()
@@ -948,6 +960,32 @@ class TestBondedSelection(object):
         with pytest.warns(UserWarning):
             u.select_atoms('bonded name AAA')
 
+    @pytest.mark.parametrize('ix, sel', [
+        (slice(None), 'name N'),
+        (slice(100, 900), 'name CA'),
+        (slice(None, None, 3), 'global name CA'),
+    ])
+    def test_bonded_partners(self, u, ix, sel):
+        group = u.atoms[ix]
+        grp = group.select_atoms(sel)
+        ref = set()
+        for b in group.bonds:
+            a1, a2 = b.indices
+            if a1 in grp.indices:
+                ref.add(a2)
+            if a2 in grp.indices:
+                ref.add(a1)
+        ag = group.select_atoms('bonded ' + sel)
+        assert_equal(ag.indices, sorted(ref))
+
+    def test_bonded_added_bonds(self, u):
+        ag = u.select_atoms('bonded index 0')
+        u.add_bonds([(0, 100)])
+        assert_equal(u.select_atoms('bonded index 0').indices,
+                     np.union1d(ag.indices, [100]))
+        u.delete_bonds([(0, 100)])
+        assert_equal(u.select_atoms('bonded index 0').indices, ag.indices)
+
 
 class TestSelectionErrors(object):
     @staticmethod
@@ -1347,3 +1385,102 @@ def test_error_selection_for_strange_dtype():
     with pytest.raises(ValueError, match="No base class defined for dtype"):
         MDAnalysis.core.selection.gen_selection_class("star", "stars",
                                                       dict, "atom")
+
+
+@pytest.mark.parametrize('ix, other_ix', [
+    ([], [1, 2]),
+    ([5, 3, 3, 9], []),
+    ([5, 3, 3, 9, 0], [3, 0, 7]),
+    ([0, 1, 2, 3, 4], [4, 3, 2, 1, 0, 0]),
+])
+def test_isin_group(ix, other_ix):
+    u = make_Universe()
+    group, other = u.atoms[ix], u.atoms[other_ix]
+    mask = MDAnalysis.core.selection.isin_group(group, other)
+    assert_equal(mask, np.isin(group.indices, other.indices))
+
+
+@pytest.mark.parametrize('idx', [[], [3, 1, 3, 0, 1], [4, 2, 2]])
+def test_unique_subset(idx):
+    u = make_Universe()
+    group = u.atoms[[50, 10, 30, 20, 40]]
+    ag = MDAnalysis.core.selection._unique_subset(group, idx)
+    assert_equal(ag.ix, np.unique(group.ix[idx]).astype(np.intp))
+    assert ag.isunique
+    assert ag.unique is ag
+
+
+@pytest.mark.parametrize('lsel, rsel', [
+    ('protein', 'name CA'),
+    ('around 5 resid 10', 'name C*'),
+    ('name C*', 'around 5 resid 10'),
+    ('byres name OG1', 'not backbone'),
+    ('resid 1:30', 'same segid as index 4'),
+    ('not (resname ARG or name H*)', 'prop z > 5'),
+    ('name CA', 'global resid 50'),
+    ('global resid 50', 'name CA'),
+    ('name C*', 'bonded name N'),
+    ('bonded name N', 'name C*'),
+])
+def test_and_matches_intersection(lsel, rsel):
+    u = mda.Universe(PSF, DCD)
+    ag = u.atoms[100:500]
+    sel = ag.select_atoms(f'({lsel}) and ({rsel})')
+    ref = ag.select_atoms(lsel).indices
+    ref = ref[np.isin(ref, ag.select_atoms(rsel).indices)]
+    assert_equal(sel.indices, ref)
+
+
+@pytest.mark.parametrize('selstr', ['resid 999 and name CA',
+                                    'name CA and resid 999'])
+def test_and_missing_attribute_raises(selstr):
+    u = make_Universe(('resids',))
+    with pytest.raises(AttributeError):
+        u.select_atoms(selstr)
+
+
+@pytest.mark.parametrize('selstr, atomwise', [
+    ('name CA', True),
+    ('protein and resid 1:10', True),
+    ('not backbone', True),
+    ('around 5 resid 10', False),
+    ('name CA or byres index 1', False),
+    ('not global name CA', False),
+])
+def test_atomwise(selstr, atomwise):
+    sel = Parser.parse(selstr, {})
+    assert sel.atomwise is atomwise
+
+
+@pytest.mark.parametrize('values', [
+    ['CA'], ['CA', 'NOPE'], ['C*'], ['H?1', 'CA', 'O[GD]*'], ['[!C]*'],
+])
+def test_string_selection_wildcards(values):
+    u = mda.Universe(PSF, DCD)
+    sel = u.select_atoms('name ' + ' '.join(values))
+    ref = [any(fnmatch.fnmatchcase(name, val) for val in values)
+           for name in u.atoms.names]
+    assert_equal(sel.indices, u.atoms.indices[ref])
+
+
+class TestParseTreeCache(object):
+    def test_reused(self):
+        tree = Parser.parse('name CA and resid 1:10', {})
+        assert Parser.parse('name CA  and resid 1:10 ', {}) is tree
+        assert Parser.parse('name CA and resid 1:10', {},
+                            periodic=False) is not tree
+
+    def test_not_reused_with_selgroups(self):
+        u = make_Universe(('names',))
+        groups = {'this': u.atoms[:5]}
+        tree = Parser.parse('group this', groups)
+        assert Parser.parse('group this', groups) is not tree
+
+    def test_cleared_for_new_keyword(self):
+        tree = Parser.parse('name CA', {})
+        MDAnalysis.core.selection.gen_selection_class(
+            'parsecachetest', 'parsecachetests', int, 'atom')
+        try:
+            assert Parser.parse('name CA', {}) is not tree
+        finally:
+            del MDAnalysis.core.selection._SELECTIONDICT['parsecachetest']
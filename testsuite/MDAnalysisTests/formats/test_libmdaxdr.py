@@ -21,6 +21,7 @@
 # J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
 #
 import pickle
+import threading
 
 import numpy as np
 
@@ -267,6 +268,86 @@ def test_xyz_xtc(xtc):
         assert_array_almost_equal(frame.x, ones * i, decimal=3)
 
 
+@pytest.mark.parametrize('chunksize', [1, 3, 10, 16])
+def test_read_chunk_xtc(xtc, chunksize):
+    frames = list(xtc)
+    xtc.seek(0)
+    xyz = np.empty((chunksize, xtc.n_atoms, 3), dtype=np.float32)
+    box = np.empty((chunksize, 3, 3), dtype=np.float32)
+    step = np.empty(chunksize, dtype=np.int32)
+    time = np.empty(chunksize, dtype=np.float32)
+    i = 0
+    n_read = chunksize
+    while n_read == chunksize:
+        n_read = xtc.read_chunk(xyz, box, step, time)
+        for j in range(n_read):
+            assert_array_equal(xyz[j], frames[i].x)
+            assert_array_equal(box[j], frames[i].box)
+            assert step[j] == frames[i].step
+            assert time[j] == frames[i].time
+            i += 1
+    assert i == len(frames)
+    assert xtc.tell() == len(frames)
+
+
+def test_read_chunk_xtc_wrong_shape(xtc):
+    xyz = np.empty((2, xtc.n_atoms + 1, 3), dtype=np.float32)
+    box = np.empty((2, 3, 3), dtype=np.float32)
+    with pytest.raises(ValueError):
+        xtc.read_chunk(xyz, box, np.empty(2, dtype=np.int32),
+                       np.empty(2, dtype=np.float32))
+
+
+def test_read_direct_x_xtc(xtc):
+    frames = list(xtc)
+    xtc.seek(0)
+    xyz = np.empty((xtc.n_atoms, 3), dtype=np.float32)
+    for ref in frames:
+        frame = xtc.read_direct_x(xyz)
+        assert frame.x is xyz
+        assert_array_equal(xyz, ref.x)
+        assert_array_equal(frame.box, ref.box)
+        assert frame.step == ref.step
+        assert frame.time == ref.time
+    assert xtc.tell() == len(frames)
+
+
+@pytest.mark.parametrize('xyz', [
+    np.empty((11, 3), dtype=np.float32),
+    np.empty((10, 3), dtype=np.float64),
+    np.empty((10, 3), dtype=np.float32, order='F'),
+])
+def test_read_direct_x_xtc_wrong_array(xtc, xyz):
+    with pytest.raises(ValueError):
+        xtc.read_direct_x(xyz)
+
+
+@pytest.mark.parametrize('fname, xdr', ((XTC_multi_frame, XTCFile),
+                                        (TRR_multi_frame, TRRFile)))
+def test_shared_between_threads(fname, xdr):
+    # concurrent calls on one file must either succeed or be refused with a
+    # RuntimeError, never run the XDR library twice at the same time
+    unexpected = []
+
+    def work(f):
+        for _ in range(50):
+            try:
+                f.seek(0)
+                f.read()
+            except RuntimeError:
+                pass
+            except Exception as err:  # pragma: no cover
+                unexpected.append(err)
+
+    with xdr(fname) as f:
+        threads = [threading.Thread(target=work, args=(f,)) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    assert not unexpected
+
+
 def test_box_trr(trr):
     box = np.eye(3) * 20
     for frame in trr:
@@ -28,6 +28,7 @@ from itertools import combinations_with_replacement as comb
 import MDAnalysis
 from MDAnalysis.lib import distances
 from MDAnalysis.lib import mdamath
+from MDAnalysis.lib.util import check_box
 from MDAnalysis.tests.datafiles import PSF, DCD, TRIC
 
 
@@ -131,6 +132,52 @@ def test_capped_distance_checkbrute(npoints, box, query, method, min_cutoff):
 
     assert_equal(np.sort(found_pairs, axis=0), np.sort(indices[1], axis=0))
 
+@pytest.mark.parametrize('block_size', [1, 7, 100, 2**20])
+@pytest.mark.parametrize('min_cutoff', min_cutoff_1)
+@pytest.mark.parametrize('box', boxes_1)
+def test_capped_distance_bruteforce_blocks(block_size, min_cutoff, box,
+                                           monkeypatch):
+    np.random.seed(90003)
+    query = (np.random.uniform(size=(30, 3)) * 3 - 1).astype(np.float32)
+    points = (np.random.uniform(size=(100, 3)) * 3 - 1).astype(np.float32)
+    query_in, points_in = query.copy(), points.copy()
+    dists = distances.distance_array(query, points, box=box)
+    lower = -1 if min_cutoff is None else min_cutoff
+    ref_pairs = np.argwhere((dists <= 0.3) & (dists > lower))
+    monkeypatch.setattr(distances, '_BRUTEFORCE_BLOCK_SIZE', block_size)
+    pairs, dist = distances.capped_distance(
+        query, points, 0.3, min_cutoff=min_cutoff, box=box,
+        method='bruteforce')
+    assert len(pairs) > 0
+    assert_equal(pairs, ref_pairs)
+    assert_almost_equal(dist, dists[ref_pairs[:, 0], ref_pairs[:, 1]])
+    # the input coordinates are not wrapped in place
+    assert_equal(query, query_in)
+    assert_equal(points, points_in)
+
+@pytest.mark.parametrize('box', boxes_1)
+@pytest.mark.parametrize('backend', ['serial', 'openmp'])
+def test_distance_array_sq_kernels(box, backend):
+    np.random.seed(90003)
+    query = (np.random.uniform(size=(10, 3)) * 3).astype(np.float32)
+    points = (np.random.uniform(size=(20, 3)) * 3).astype(np.float32)
+    ref = distances.distance_array(query, points, box=box)
+    sq = np.empty((10, 20), dtype=np.float64)
+    if box is None:
+        distances._run("calc_distance_array_sq", args=(query, points, sq),
+                       backend=backend)
+    else:
+        boxtype, box = check_box(box)
+        if boxtype == 'ortho':
+            distances._run("calc_distance_array_sq_ortho",
+                           args=(query, points, box, sq), backend=backend)
+        else:
+            distances._run("triclinic_pbc", args=(query, box))
+            distances._run("triclinic_pbc", args=(points, box))
+            distances._run("calc_distance_array_sq_triclinic_prewrapped",
+                           args=(query, points, box, sq), backend=backend)
+    assert_almost_equal(sq, ref**2, decimal=5)
+
 # for coverage
 @pytest.mark.parametrize('npoints', npoints_1)
 @pytest.mark.parametrize('box', boxes_1)